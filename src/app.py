@@ -11,81 +11,91 @@ from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
+# Skip the interactive docs and OpenAPI schema when running under tests
+_docs_kwargs = {}
+if os.getenv("TESTING") == "1":
+    _docs_kwargs = {"docs_url": None, "redoc_url": None, "openapi_url": None}
+
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              **_docs_kwargs)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are sets for O(1) membership checks)
 activities = {
     "Soccer Team": {
         "description": "Join the school soccer team and compete in regional matches",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+        "participants": {"alex@mergington.edu", "sarah@mergington.edu"}
         },
         "Basketball Club": {
         "description": "Practice basketball skills and play friendly matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "emily@mergington.edu"]
+        "participants": {"james@mergington.edu", "emily@mergington.edu"}
         },
         "Art Studio": {
         "description": "Explore painting, drawing, and mixed media art techniques",
         "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["lily@mergington.edu", "noah@mergington.edu"]
+        "participants": {"lily@mergington.edu", "noah@mergington.edu"}
         },
         "Drama Club": {
         "description": "Perform in plays and develop acting and stage skills",
         "schedule": "Mondays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["ava@mergington.edu", "william@mergington.edu"]
+        "participants": {"ava@mergington.edu", "william@mergington.edu"}
         },
         "Science Club": {
         "description": "Conduct experiments and participate in science fairs",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
         },
         "Debate Team": {
         "description": "Develop critical thinking and public speaking through debates",
         "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
         "max_participants": 14,
-        "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
+        "participants": {"ethan@mergington.edu", "isabella@mergington.edu"}
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
 
-@app.get("/")
+@app.api_route("/", methods=["GET", "HEAD"])
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; serialize them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +113,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -2,48 +2,124 @@
 Tests for the High School Management System API
 """
 
+import asyncio
+
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Pre-quoted endpoint paths
+_SOCCER_SIGNUP = "/activities/Soccer%20Team/signup"
+_SOCCER_UNREG = "/activities/Soccer%20Team/unregister"
+
+# Students signed up in the initial activities
+_ALEX, _SARAH, _JAMES, _EMILY, _LILY, _NOAH = (
+    "alex@mergington.edu",
+    "sarah@mergington.edu",
+    "james@mergington.edu",
+    "emily@mergington.edu",
+    "lily@mergington.edu",
+    "noah@mergington.edu",
+)
+
+# Student signed up by the single-signup tests
+_NEW_STUDENT = "newstudent@mergington.edu"
+
+# Students signed up in the multiple-signup test
+_NEW_EMAILS = (
+    "student1@mergington.edu",
+    "student2@mergington.edu",
+    "student3@mergington.edu",
+)
+
+# Initial activities state for the tests
+_INITIAL_ACTIVITIES = {
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in regional matches",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": {_ALEX, _SARAH}
+    },
+    "Basketball Club": {
+        "description": "Practice basketball skills and play friendly matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": {_JAMES, _EMILY}
+    },
+    "Art Studio": {
+        "description": "Explore painting, drawing, and mixed media art techniques",
+        "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": {_LILY, _NOAH}
+    },
+}
+
+
+def _json(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+def _reset_activities(activities):
+    """Replace activities with a fresh copy of the initial state"""
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": set(details["participants"])}
+        for name, details in _INITIAL_ACTIVITIES.items()
+    })
+
+
+@pytest.fixture(scope="session")
+def testing_env():
+    """Set TESTING=1 for the session so the app disables its docs routes"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("TESTING", "1")
+        yield
+
+
+@pytest.fixture(scope="session")
+def app_mod(testing_env):
+    """Import the app module lazily so it can be patched before use"""
+    import app as module
+    return module
+
+
+@pytest.fixture(scope="session")
+def client(app_mod):
+    """Create a test client shared across the session"""
+    with TestClient(app_mod.app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def aclient(app_mod):
+    """Create an async client that calls the app in-process"""
+    transport = httpx.ASGITransport(app=app_mod.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
 
-from app import app, activities
+
+@pytest.fixture(scope="session", autouse=True)
+def initial_activities(app_mod):
+    """Load the initial activities once for the session"""
+    _reset_activities(app_mod.activities)
 
 
 @pytest.fixture
-def client():
-    """Create a test client"""
-    return TestClient(app)
+def mutable_activities(app_mod):
+    """Restore initial activities after a test that modifies them"""
+    yield app_mod.activities
+    _reset_activities(app_mod.activities)
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    activities.clear()
-    activities.update({
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in regional matches",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "emily@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media art techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["lily@mergington.edu", "noah@mergington.edu"]
-        },
-    })
-    yield
+@pytest.fixture
+def activities_json(client):
+    """Fetch the decoded /activities response"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return _json(response)
 
 
 class TestRootEndpoint:
@@ -51,168 +127,182 @@ class TestRootEndpoint:
 
     def test_root_redirects_to_static(self, client):
         """Test that root redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = client.request("GET", "/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
+    def test_root_head_redirects_to_static(self, client):
+        """Test that a HEAD request to root gets the same redirect"""
+        response = client.head("/", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"] == "/static/index.html"
+
+
+class TestDocsDisabled:
+    """Tests that the docs routes are off when TESTING is set"""
+
+    @pytest.mark.parametrize("path", ["/docs", "/redoc", "/openapi.json"])
+    def test_docs_routes_not_found(self, client, path):
+        """Test that docs and OpenAPI schema routes return 404"""
+        response = client.get(path)
+        assert response.status_code == 404
+
 
 class TestActivitiesEndpoint:
     """Tests for the activities endpoint"""
 
-    def test_get_activities(self, client):
+    def test_get_activities(self, activities_json):
         """Test retrieving all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_json
         assert "Soccer Team" in data
         assert "Basketball Club" in data
         assert "Art Studio" in data
 
-    def test_activities_structure(self, client):
+    def test_activities_structure(self, activities_json):
         """Test that activity data has correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        soccer = data["Soccer Team"]
+        soccer = activities_json["Soccer Team"]
         assert "description" in soccer
         assert "schedule" in soccer
         assert "max_participants" in soccer
         assert "participants" in soccer
         assert isinstance(soccer["participants"], list)
+        assert soccer["participants"] == [_ALEX, _SARAH]
 
 
 class TestSignupEndpoint:
     """Tests for the signup endpoint"""
 
-    def test_signup_success(self, client):
+    def test_signup_success(self, client, mutable_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Soccer Team/signup?email=newstudent@mergington.edu"
+            _SOCCER_SIGNUP,
+            params={"email": _NEW_STUDENT},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
+        assert _NEW_STUDENT in data["message"]
 
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Soccer Team"]["participants"]
+        assert _NEW_STUDENT in mutable_activities["Soccer Team"]["participants"]
+
+    def test_signup_appears_in_activities(self, client, mutable_activities):
+        """Test that a signup is returned, sorted, by the activities endpoint"""
+        client.post(_SOCCER_SIGNUP, params={"email": _NEW_STUDENT})
+
+        response = client.get("/activities")
+        participants = _json(response)["Soccer Team"]["participants"]
+        assert participants == [_ALEX, _NEW_STUDENT, _SARAH]
 
     def test_signup_duplicate(self, client):
         """Test that duplicate signup is rejected"""
         response = client.post(
-            "/activities/Soccer Team/signup?email=alex@mergington.edu"
+            _SOCCER_SIGNUP,
+            params={"email": _ALEX},
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"].lower()
-
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        data = _json(response)
+        assert data["detail"] == "Student already signed up for this activity"
 
-    def test_signup_updates_participants_list(self, client):
+    def test_signup_updates_participants_list(self, client, mutable_activities):
         """Test that signup adds student to participants list"""
         email = "newparticipant@mergington.edu"
-        initial_count = len(activities["Soccer Team"]["participants"])
+        participants = mutable_activities["Soccer Team"]["participants"]
+        initial_count = len(participants)
         
-        client.post(f"/activities/Soccer Team/signup?email={email}")
+        client.post(_SOCCER_SIGNUP, params={"email": email})
         
-        new_count = len(activities["Soccer Team"]["participants"])
-        assert new_count == initial_count + 1
-        assert email in activities["Soccer Team"]["participants"]
+        assert len(participants) == initial_count + 1
+        assert email in participants
 
 
 class TestUnregisterEndpoint:
     """Tests for the unregister endpoint"""
 
-    def test_unregister_success(self, client):
+    def test_unregister_success(self, client, mutable_activities):
         """Test successful unregistration from an activity"""
         response = client.delete(
-            "/activities/Soccer Team/unregister?email=alex@mergington.edu"
+            _SOCCER_UNREG,
+            params={"email": _ALEX},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "message" in data
-        assert "alex@mergington.edu" in data["message"]
+        assert _ALEX in data["message"]
 
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Soccer Team"]["participants"]
+        assert _ALEX not in mutable_activities["Soccer Team"]["participants"]
 
     def test_unregister_not_signed_up(self, client):
         """Test that unregistering a non-participant is rejected"""
         response = client.delete(
-            "/activities/Soccer Team/unregister?email=notregistered@mergington.edu"
+            _SOCCER_UNREG,
+            params={"email": "notregistered@mergington.edu"},
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"].lower()
+        data = _json(response)
+        assert data["detail"] == "Student not signed up for this activity"
 
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    def test_unregister_removes_from_participants_list(self, client):
+    def test_unregister_removes_from_participants_list(self, client, mutable_activities):
         """Test that unregister removes student from participants list"""
-        email = "alex@mergington.edu"
-        initial_count = len(activities["Soccer Team"]["participants"])
-        assert email in activities["Soccer Team"]["participants"]
+        email = _ALEX
+        participants = mutable_activities["Soccer Team"]["participants"]
+        initial_count = len(participants)
+        assert email in participants
         
-        client.delete(f"/activities/Soccer Team/unregister?email={email}")
+        client.delete(_SOCCER_UNREG, params={"email": email})
         
-        new_count = len(activities["Soccer Team"]["participants"])
-        assert new_count == initial_count - 1
-        assert email not in activities["Soccer Team"]["participants"]
+        assert len(participants) == initial_count - 1
+        assert email not in participants
+
+
+class TestNonexistentActivity:
+    """Tests for requests against an unknown activity"""
+
+    @pytest.mark.parametrize("method,path", [
+        ("POST", "/activities/Nonexistent%20Activity/signup"),
+        ("DELETE", "/activities/Nonexistent%20Activity/unregister"),
+    ])
+    def test_nonexistent_activity(self, client, method, path):
+        """Test signup and unregister for non-existent activity"""
+        response = client.request(
+            method, path, params={"email": "test@mergington.edu"}
+        )
+        assert response.status_code == 404
+        data = _json(response)
+        assert data["detail"] == "Activity not found"
 
 
 class TestActivityCapacity:
     """Tests for activity capacity management"""
 
-    def test_multiple_signups(self, client):
+    @pytest.mark.asyncio
+    async def test_multiple_signups(self, aclient, mutable_activities):
         """Test multiple students can sign up for same activity"""
-        emails = [
-            "student1@mergington.edu",
-            "student2@mergington.edu",
-            "student3@mergington.edu"
-        ]
-        
-        for email in emails:
-            response = client.post(f"/activities/Soccer Team/signup?email={email}")
+        responses = await asyncio.gather(*[
+            aclient.post(_SOCCER_SIGNUP, params={"email": email})
+            for email in _NEW_EMAILS
+        ])
+        for response in responses:
             assert response.status_code == 200
         
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        participants = activities_data["Soccer Team"]["participants"]
+        participants = mutable_activities["Soccer Team"]["participants"]
         
-        for email in emails:
+        for email in _NEW_EMAILS:
             assert email in participants
 
-    def test_spots_available_calculation(self, client):
+    def test_spots_available_calculation(self, client, mutable_activities):
         """Test that available spots decrease with signups"""
-        activities_response = client.get("/activities")
-        initial_data = activities_response.json()
-        initial_participants = len(initial_data["Soccer Team"]["participants"])
-        max_participants = initial_data["Soccer Team"]["max_participants"]
-        initial_spots = max_participants - initial_participants
+        soccer = mutable_activities["Soccer Team"]
+        max_participants = soccer["max_participants"]
+        initial_spots = max_participants - len(soccer["participants"])
         
         # Sign up one student
-        client.post("/activities/Soccer Team/signup?email=newstudent@mergington.edu")
+        client.post(
+            _SOCCER_SIGNUP,
+            params={"email": _NEW_STUDENT},
+        )
         
-        activities_response = client.get("/activities")
-        new_data = activities_response.json()
-        new_participants = len(new_data["Soccer Team"]["participants"])
-        new_spots = max_participants - new_participants
+        new_spots = max_participants - len(soccer["participants"])
         
         assert new_spots == initial_spots - 1